@@ -6,108 +6,620 @@ Posts drops to the oPOErator hub API, which handles CDN upload + storage.
 Works from anywhere: local machine, OpenClaw, CI, scripts.
 
 Usage:
-  python3 drop.py <file.md> [options]
+  python3 drop.py <file.md> [<file.md> ...] [options]
   python3 drop.py --stdin --title "My drop" [options]
   echo "hello" | python3 drop.py --stdin --title "Quick note"
 
 Examples:
   python3 drop.py checkpoint.md --from claude-code --type checkpoint
   python3 drop.py note.md --from openclaw --type context
+  python3 drop.py notes/*.md --from openclaw
   python3 drop.py --list
   python3 drop.py --list --from openclaw --since 2026-02-06
+  python3 drop.py --list --refresh
+  python3 drop.py --read 2026-02-06-050000-checkpoint 2026-02-06-043000-cidr-fix
 """
 
+import io
 import sys
 import os
+import re
 import json
+import stat
+import time
+import codecs
 import argparse
+import threading
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
+from functools import lru_cache
+from urllib.parse import urlsplit, urlencode, urljoin, unquote
+
+try:
+    import orjson  # optional: several times faster than stdlib json
+except ImportError:
+    orjson = None
+
+if orjson:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+    _loads = json.loads
+
+# Local .env files searched (in order) when no key is set in the environment
+ENV_FILES = [
+    Path("/Users/home/Library/Mobile Documents/com~apple~CloudDocs/Code/deploy_bridge/opoerator-hub/.env"),
+    Path(".env"),
+    Path(os.path.expanduser("~/.drop-env")),
+]
+# {abs path: [mtime_ns, key]} — lets repeat runs stat() instead of re-reading .env files
+ENV_CACHE = Path(os.path.expanduser("~/.drop-env.cache"))
+ENV_KEY_RE = re.compile(r"^INGEST_API_KEY=(.*)$", re.MULTILINE)
+
+
+def write_private(path, text):
+    """Best-effort atomic write of a 0600 cache file; caches are never required."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _read_env_key(env_path):
+    match = ENV_KEY_RE.search(env_path.read_text())
+    return match.group(1).strip().strip("\"'") if match else ""
+
+
+def _load_api_key():
+    """Return INGEST_API_KEY from the first local .env file that sets one."""
+    try:
+        cache = json.loads(ENV_CACHE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+
+    key = ""
+    stale = False
+    for env_path in ENV_FILES:
+        try:
+            mtime = env_path.stat().st_mtime_ns
+        except OSError:
+            continue
+        cache_key = os.path.abspath(env_path)
+        cached = cache.get(cache_key)
+        if cached and cached[0] == mtime:
+            key = cached[1]
+        else:
+            key = _read_env_key(env_path)
+            cache[cache_key] = [mtime, key]
+            stale = True
+        if key:
+            break
+
+    if stale:
+        # The cache holds the key itself, so keep it as private as ~/.drop-env
+        write_private(ENV_CACHE, json.dumps(cache))
+    return key
+
 
 # Hub API config — override with env vars
 HUB_URL = os.getenv("DROP_HUB_URL", "https://hub-production-f423.up.railway.app")
-API_KEY = os.getenv("DROP_API_KEY") or os.getenv("INGEST_API_KEY", "")
-
-# Try loading from local .env files if not set
-if not API_KEY:
-    for env_path in [
-        Path("/Users/home/Library/Mobile Documents/com~apple~CloudDocs/Code/deploy_bridge/opoerator-hub/.env"),
-        Path(".env"),
-        Path(os.path.expanduser("~/.drop-env")),
-    ]:
-        if env_path.exists():
-            for line in env_path.read_text().splitlines():
-                if line.startswith("INGEST_API_KEY="):
-                    API_KEY = line.split("=", 1)[1].strip().strip("\"'")
-                    break
-            if API_KEY:
+API_KEY = os.getenv("DROP_API_KEY") or os.getenv("INGEST_API_KEY", "") or _load_api_key()
+# gzip request bodies over GZIP_MIN_SIZE bytes — only if the hub decodes Content-Encoding
+GZIP_UPLOADS = os.getenv("DROP_HUB_GZIP", "") == "1"
+GZIP_MIN_SIZE = 1024
+
+# Sent on every request — built once instead of per call
+HEADERS = {
+    "Content-Type": "application/json",
+    "Accept-Encoding": "gzip",
+    "X-API-Key": API_KEY,
+}
+
+# Retry transient gateway errors (Railway deploys/restarts) with exponential backoff
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = {502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD"}
+# Redirects are followed (GET/HEAD only) while they stay on the hub's origin
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+
+# Conditional-GET cache for hub responses: {"etag", "last_modified", "body", "ts"}
+CACHE_DIR = Path(os.path.expanduser("~/.cache/drop"))
+# Without an ETag/Last-Modified from the hub, cached lists are reused for this long
+LIST_CACHE_TTL = 30
+# Last --list window per (hub, sender, type, limit): {"latest_ts", "full_at", "drops": {id: drop}}
+LIST_CURSORS = CACHE_DIR / "list_cursor.json"
+# Deltas can't see hub-side deletes or late-timestamped drops, so refetch in full this often
+LIST_CURSOR_MAX_AGE = 10 * 60
+# Resolved hub addresses, shared across runs so back-to-back invocations skip DNS
+DNS_CACHE = CACHE_DIR / "dns.json"
+DNS_CACHE_TTL = 300
+
+# Drop files are streamed to the hub this many bytes at a time
+CHUNK_SIZE = 64 * 1024
+
+# First "# heading"; anything past the first 64 KiB isn't treated as a title
+TITLE_RE = re.compile(r"^[ \t]*#[ \t]+(\S.*?)\s*$", re.MULTILINE)
+TITLE_BYTES_RE = re.compile(TITLE_RE.pattern.encode(), re.MULTILINE)
+TITLE_SCAN_LIMIT = 64 * 1024
+
+# Two header lines per drop in --list output
+LIST_ROW = "  [{type:10}] {id}\n             from={sender} {store} {ts}\n"
+
+# Max concurrent hub requests when dropping or reading several at once
+BATCH_WORKERS = 16
+
+_hub = urlsplit(HUB_URL)
+_local = threading.local()
+_resolved = {}
+
+
+def _resolve(host, port):
+    """Return cached addresses for ``host``, resolving and persisting them when stale."""
+    import socket
+
+    now = time.time()
+    entry = _resolved.get(host)
+    if entry is None:
+        entry = (_load_cached(DNS_CACHE) or {}).get(host)
+    if entry is None or now - entry["ts"] >= DNS_CACHE_TTL:
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addrs = list(dict.fromkeys(info[4][0] for info in infos))
+        entry = {"addrs": addrs, "ts": now}
+        cache = _load_cached(DNS_CACHE) or {}
+        cache[host] = entry
+        write_private(DNS_CACHE, json.dumps(cache))
+    _resolved[host] = entry
+    return entry["addrs"]
+
+
+def _create_connection(address, timeout, source_address=None):
+    """socket.create_connection, but dialing the cached addresses for the host.
+
+    TLS SNI and the Host header still use the hostname; only the lookup is skipped.
+    """
+    import socket
+
+    host, port = address
+    for addr in _resolve(host, port):
+        try:
+            return socket.create_connection((addr, port), timeout, source_address)
+        except OSError:
+            continue
+    # Every cached address failed — the host may have moved, so look it up fresh
+    # and let the next connection re-resolve and re-persist
+    _resolved[host] = {"addrs": [], "ts": 0}
+    return socket.create_connection(address, timeout, source_address)
+
+
+@lru_cache(maxsize=None)
+def _hub_proxy():
+    """Return the split proxy URL for the hub from HTTP(S)_PROXY/NO_PROXY, or None.
+
+    Same environment lookup urlopen does, so proxied CI runners keep working.
+    """
+    from urllib.request import getproxies, proxy_bypass
+
+    proxy = getproxies().get(_hub.scheme)
+    if not proxy or proxy_bypass(_hub.hostname):
+        return None
+    return urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+
+@lru_cache(maxsize=None)
+def _proxy_headers():
+    proxy = _hub_proxy()
+    if proxy is None or proxy.username is None:
+        return {}
+    import base64
+
+    creds = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    return {"Proxy-Authorization": f"Basic {base64.b64encode(creds.encode()).decode()}"}
+
+
+def _connection():
+    """Return this thread's keep-alive connection to the hub, opening it on first use.
+
+    Reusing one socket skips the TCP + TLS handshake on every call after the first.
+    http.client connections aren't thread-safe, so batch workers each get their own.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        # Deferred: http.client + ssl are most of the import time, and --help never needs them
+        from http.client import HTTPConnection, HTTPSConnection
+
+        conn_cls = HTTPSConnection if _hub.scheme == "https" else HTTPConnection
+        proxy = _hub_proxy()
+        if proxy is None:
+            conn = conn_cls(_hub.netloc, timeout=30)
+        else:
+            conn = conn_cls(proxy.hostname, proxy.port or 80, timeout=30)
+            if _hub.scheme == "https":
+                # CONNECT tunnel; TLS is still negotiated end to end with the hub
+                conn.set_tunnel(_hub.hostname, _hub.port, headers=_proxy_headers())
+        conn._create_connection = _create_connection
+        _local.conn = conn
+    return conn
+
+
+def _digest(*parts):
+    import hashlib
+
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def _cache_prefix(method, path):
+    return _digest(HUB_URL, method, path)[:16]
+
+
+def _cache_path(method, path, params):
+    # "<endpoint>-<params>.json", so every cached query of one endpoint can be found
+    params_key = _digest(sorted((params or {}).items()))[:32]
+    return CACHE_DIR / f"{_cache_prefix(method, path)}-{params_key}.json"
+
+
+def _invalidate_cached(path):
+    """Drop every cached GET of ``path`` — its TTL entries would hide this client's write."""
+    for cache_file in CACHE_DIR.glob(f"{_cache_prefix('GET', path)}-*.json"):
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+
+
+def _load_cached(cache_file):
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _send(method, url, data, stream, headers):
+    """Send one request, retrying transient failures; returns (response, body bytes)."""
+    import socket
+    from http.client import BadStatusLine, HTTPException
+
+    if _hub_proxy() is not None and _hub.scheme == "http":
+        # Plain-HTTP proxies take the absolute URL in the request line
+        url = f"{_hub.scheme}://{_hub.netloc}{url}"
+        headers = {**headers, **_proxy_headers()}
+
+    for attempt in range(RETRY_TOTAL + 1):
+        conn = _connection()
+        reused = conn.sock is not None
+        if not reused:
+            try:
+                conn.connect()
+            except OSError as e:
+                # Nothing was sent, so retrying is safe for any method — but a hub
+                # that doesn't answer within the timeout won't answer a retry either
+                conn.close()
+                if attempt == RETRY_TOTAL or isinstance(e, socket.timeout):
+                    raise
+                time.sleep(RETRY_BACKOFF * (2 ** attempt))
+                continue
+        if stream is not None:
+            data = stream()
+        try:
+            conn.request(method, url, body=data, headers=headers)
+            resp = conn.getresponse()
+            payload = resp.read()
+        except BaseException as e:
+            # Anything escaping mid-request (e.g. from the body stream) leaves the
+            # connection half-written, so it must not be reused either way
+            conn.close()
+            if not isinstance(e, (HTTPException, OSError)):
+                raise
+            # Once the request is sent, a POST may already have landed; re-sending it
+            # would duplicate the drop. The exception is a reused keep-alive socket the
+            # hub had already closed — retried once, since the retry uses a fresh socket.
+            # A timeout isn't retried for any method: each attempt would wait the full
+            # 30 s again, turning a hung hub into a two-minute hang.
+            stale = reused and isinstance(e, (ConnectionError, BadStatusLine))
+            if (attempt == RETRY_TOTAL or isinstance(e, socket.timeout)
+                    or (method not in IDEMPOTENT_METHODS and not stale)):
+                raise
+        else:
+            retryable = resp.status in RETRY_STATUSES and method in IDEMPOTENT_METHODS
+            if not retryable or attempt == RETRY_TOTAL:
                 break
+        time.sleep(RETRY_BACKOFF * (2 ** attempt))
+    return resp, payload
+
+
+def api_request(method, path, body=None, params=None, stream=None, cache_ttl=None):
+    """Make an authenticated request to the hub API.
 
+    ``stream`` is a zero-arg callable returning an iterable of body bytes, sent
+    with chunked transfer encoding. It's called again if the request is retried.
 
-def api_request(method, path, body=None, params=None):
-    """Make an authenticated request to the hub API."""
-    url = f"{HUB_URL}{path}"
+    ``cache_ttl`` enables the on-disk cache for a GET: the cached body is revalidated
+    with If-None-Match/If-Modified-Since, or reused for ``cache_ttl`` seconds when the
+    hub sent neither validator.
+    """
+    # Needed on nearly every call: responses are requested with Accept-Encoding: gzip
+    import gzip
+
+    url = f"{_hub.path.rstrip('/')}{path}"
     if params:
-        qs = "&".join(f"{k}={v}" for k, v in params.items() if v is not None)
+        qs = urlencode({k: v for k, v in params.items() if v is not None}, doseq=True)
         if qs:
             url += f"?{qs}"
 
-    data = json.dumps(body).encode() if body else None
-    req = Request(url, data=data, method=method)
-    req.add_header("Content-Type", "application/json")
-    req.add_header("X-API-Key", API_KEY)
-
-    try:
-        with urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read())
-    except HTTPError as e:
-        error_body = e.read().decode() if e.fp else str(e)
-        print(f"API error ({e.code}): {error_body}", file=sys.stderr)
+    data = _dumps(body) if body else None
+    headers = HEADERS
+
+    cache_file = cached = None
+    if cache_ttl is not None and method == "GET":
+        cache_file = _cache_path(method, path, params)
+        cached = _load_cached(cache_file)
+        if cached:
+            validators = {}
+            if cached.get("etag"):
+                validators["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                validators["If-Modified-Since"] = cached["last_modified"]
+            if not validators and time.time() - cached.get("ts", 0) < cache_ttl:
+                return _loads(cached["body"])
+            headers = {**HEADERS, **validators}
+
+    if GZIP_UPLOADS and (stream is not None or (data and len(data) > GZIP_MIN_SIZE)):
+        # Level 1: several times faster than the default for a slightly worse ratio
+        if stream is not None:
+            raw_stream = stream
+
+            def stream():
+                return gzip_chunks(raw_stream())
+        else:
+            data = gzip.compress(data, compresslevel=1)
+        headers = {**headers, "Content-Encoding": "gzip"}
+
+    for _ in range(MAX_REDIRECTS + 1):
+        resp, payload = _send(method, url, data, stream, headers)
+        location = resp.getheader("Location")
+        if resp.status not in REDIRECT_STATUSES or method not in IDEMPOTENT_METHODS or not location:
+            break
+        # Anywhere off the hub's origin would be handed the API key, so stop there
+        target = urlsplit(urljoin(f"{_hub.scheme}://{_hub.netloc}{url}", location))
+        if (target.scheme, target.netloc) != (_hub.scheme, _hub.netloc):
+            break
+        url = f"{target.path}?{target.query}" if target.query else target.path
+
+    if resp.getheader("Content-Encoding") == "gzip":
+        payload = gzip.decompress(payload)
+
+    if resp.status == 304 and cached:
+        return _loads(cached["body"])
+    if resp.status >= 300:
+        if resp.status in REDIRECT_STATUSES:
+            detail = f"redirected to {resp.getheader('Location')} (update DROP_HUB_URL?)"
+        else:
+            detail = payload.decode(errors="replace")
+        print(f"API error ({resp.status}): {detail}", file=sys.stderr)
         sys.exit(1)
+    if method not in IDEMPOTENT_METHODS:
+        _invalidate_cached(path)
+    if cache_file:
+        write_private(cache_file, json.dumps({
+            "etag": resp.getheader("ETag"),
+            "last_modified": resp.getheader("Last-Modified"),
+            "body": payload.decode(),
+            "ts": time.time(),
+        }))
+    return _loads(payload)
+
+
+def gzip_chunks(chunks):
+    """Gzip an iterable of bytes incrementally, for chunked request bodies."""
+    import zlib
+
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    for chunk in chunks:
+        out = compressor.compress(chunk)
+        if out:
+            yield out
+    yield compressor.flush()
 
 
 def extract_title(text):
-    for line in text.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("# "):
-            return stripped[2:].strip()
-    return None
+    """Return the first "# heading" in ``text`` (a str, or bytes-like such as an mmap)."""
+    if isinstance(text, str):
+        match = TITLE_RE.search(text, 0, TITLE_SCAN_LIMIT)
+        return match.group(1) if match else None
+    match = TITLE_BYTES_RE.search(text, 0, TITLE_SCAN_LIMIT)
+    return match.group(1).decode(errors="replace") if match else None
 
 
-def cmd_drop(args):
-    """Create a drop."""
-    if args.stdin:
-        content = sys.stdin.read()
-    else:
-        path = Path(args.file)
-        if not path.exists():
-            print(f"File not found: {args.file}", file=sys.stderr)
-            sys.exit(1)
-        content = path.read_text()
+def map_file(f):
+    """Map an open, non-empty regular file read-only."""
+    import mmap
+
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_text(buf):
+    """Yield UTF-8 ``buf`` as str, decoding CHUNK_SIZE bytes at a time.
+
+    Newlines are translated to "\\n" like read_text()'s universal newlines,
+    including a "\\r\\n" split across two chunks.
+    """
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(), translate=True)
+    for start in range(0, len(buf), CHUNK_SIZE):
+        yield decoder.decode(buf[start:start + CHUNK_SIZE])
+    yield decoder.decode(b"", final=True)
 
-    if not args.sender:
-        args.sender = "claude-code"
-    if not args.drop_type:
-        args.drop_type = "context"
-    title = args.title or extract_title(content) or (Path(args.file).stem if not args.stdin else "stdin-drop")
 
-    result = api_request("POST", "/api/agent-drops", body={
+def stream_json(fields, name, chunks):
+    """Yield ``fields`` as a JSON object with string field ``name`` built from ``chunks``.
+
+    Only one chunk is escaped at a time, so memory stays O(CHUNK_SIZE) however
+    large the value is. The hub receives exactly the JSON it would otherwise.
+    """
+    yield b"{" + _dumps(name) + b': "'
+    for chunk in chunks:
+        yield _dumps(chunk)[1:-1]
+    yield b'", ' + _dumps(fields)[1:] if fields else b'"}'
+
+
+def drop_fields(args, title):
+    return {
         "from_agent": args.sender,
         "title": title,
-        "content": content,
         "drop_type": args.drop_type,
         "tags": args.tags.split(",") if args.tags else [],
-    })
-
-    drop = result.get("drop", {})
-    print(f"Dropped: {drop.get('id')}")
-    print(f"  from: {drop.get('from')}")
-    print(f"  type: {drop.get('type')}")
-    if drop.get("cdn_url"):
-        print(f"  cdn:  {drop['cdn_url']}")
-    else:
-        print(f"  cdn:  (upload failed, stored without CDN)")
+    }
+
+
+def post_drop(args, content, default_title):
+    """POST one drop to the hub and return the stored drop."""
+    title = args.title or extract_title(content) or default_title
+    body = {**drop_fields(args, title), "content": content}
+
+    result = api_request("POST", "/api/agent-drops", body=body)
+    return result.get("drop", {})
+
+
+def post_drop_file(args, path):
+    """POST a file as a drop, streaming it from a memory map rather than loading it whole."""
+    with path.open("rb") as f:
+        st = os.fstat(f.fileno())
+        if not stat.S_ISREG(st.st_mode) or st.st_size == 0:
+            # Pipes, /dev/fd/N and /proc files report no size, can't be mapped and
+            # can't be re-read for a retry; read them whole like a --stdin drop
+            try:
+                content = io.TextIOWrapper(f, encoding="utf-8").read()
+            except UnicodeDecodeError:
+                print(f"Not UTF-8: {path}", file=sys.stderr)
+                sys.exit(1)
+            return post_drop(args, content, path.stem)
+
+        with map_file(f) as buf:
+            # Decode once up front: failing halfway through the chunked upload would
+            # leave the hub with a truncated body
+            try:
+                for _ in iter_text(buf):
+                    pass
+            except UnicodeDecodeError:
+                print(f"Not UTF-8: {path}", file=sys.stderr)
+                sys.exit(1)
+
+            title = args.title or extract_title(buf) or path.stem
+            fields = drop_fields(args, title)
+
+            result = api_request("POST", "/api/agent-drops",
+                                 stream=lambda: stream_json(fields, "content", iter_text(buf)))
+    return result.get("drop", {})
+
+
+def fan_out(fn, items, show):
+    """Run ``fn`` on each item, concurrently if there are several, and ``show`` each result in order.
+
+    Each worker thread keeps its own keep-alive hub connection, so a batch opens at
+    most BATCH_WORKERS connections however many requests it makes. A failed item
+    doesn't hide the rest: every result that made it is shown (those drops already
+    exist on the hub), then the failures are listed and the process exits 1.
+    """
+    if len(items) == 1:
+        show(fn(items[0]))
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    failed = []
+    # I/O-bound fan-out: wall time is roughly the slowest request, not the sum
+    with ThreadPoolExecutor(max_workers=min(BATCH_WORKERS, len(items))) as pool:
+        futures = [pool.submit(fn, item) for item in items]
+        for item, future in zip(items, futures):
+            # exception() waits without catching a Ctrl-C aimed at this thread
+            error = future.exception()
+            if error is None:
+                show(future.result())
+                continue
+            failed.append(str(item))
+            # SystemExit comes from api_request, which has already printed the hub's error
+            if not isinstance(error, SystemExit):
+                print(f"{item}: {type(error).__name__}: {error}", file=sys.stderr)
+
+    if failed:
+        print(f"Failed {len(failed)} of {len(items)}: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
+
+
+def print_drop(drop):
+    cdn = drop.get("cdn_url") or "(upload failed, stored without CDN)"
+    sys.stdout.write(
+        f"Dropped: {drop.get('id')}\n"
+        f"  from: {drop.get('from')}\n"
+        f"  type: {drop.get('type')}\n"
+        f"  cdn:  {cdn}\n"
+    )
+
+
+def cmd_drop(args):
+    """Create a drop, or one per file when several are given."""
+    if not args.sender:
+        args.sender = "claude-code"
+    if not args.drop_type:
+        args.drop_type = "context"
+
+    if args.stdin:
+        print_drop(post_drop(args, sys.stdin.read(), "stdin-drop"))
+        return
+
+    paths = [Path(f) for f in args.files]
+    missing = [p for p in paths if not p.exists()]
+    if missing:
+        for path in missing:
+            print(f"File not found: {path}", file=sys.stderr)
+        sys.exit(1)
+
+    fan_out(lambda path: post_drop_file(args, path), paths, print_drop)
+
+
+def fetch_since_cursor(args, params):
+    """Fetch only drops newer than the last listing and merge them into it.
+
+    The window kept per (hub, sender, type, limit) is the newest ``limit`` drops.
+    A delta that fills the whole limit may have skipped older new drops, so it
+    replaces the window instead of merging.
+
+    A delta only adds drops: one deleted on the hub stays listed, and one whose
+    timestamp is older than ``latest_ts`` (clock skew between agents) is missed.
+    The window is therefore refetched in full once it's LIST_CURSOR_MAX_AGE old,
+    and --refresh refetches it immediately.
+    """
+    now = time.time()
+    cursor_key = json.dumps([HUB_URL, args.sender, args.drop_type, args.limit])
+    cursors = _load_cached(LIST_CURSORS) or {}
+    cursor = None if args.refresh else cursors.get(cursor_key)
+    if cursor and now - cursor.get("full_at", 0) >= LIST_CURSOR_MAX_AGE:
+        cursor = None
+    if cursor and cursor.get("latest_ts"):
+        params = {**params, "since": cursor["latest_ts"]}
+
+    result = api_request("GET", "/api/agent-drops", params=params,
+                         cache_ttl=None if args.refresh else LIST_CACHE_TTL)
+    fetched = result.get("drops", [])
+
+    window = cursor["drops"] if cursor and len(fetched) < args.limit else {}
+    window.update((d["id"], d) for d in fetched if d.get("id"))
+    drops = sorted(window.values(), key=lambda d: d.get("timestamp") or "", reverse=True)
+    drops = drops[:args.limit]
+
+    cursors[cursor_key] = {
+        "latest_ts": max((d.get("timestamp") or "" for d in drops), default="") or None,
+        "full_at": cursor["full_at"] if cursor else now,
+        "drops": {d["id"]: d for d in drops},
+    }
+    write_private(LIST_CURSORS, json.dumps(cursors))
+    return drops
 
 
 def cmd_list(args):
@@ -117,36 +629,53 @@ def cmd_list(args):
         params["from_agent"] = args.sender
     if args.drop_type:
         params["drop_type"] = args.drop_type
-    if args.since:
-        params["since"] = args.since
     if args.limit:
         params["limit"] = str(args.limit)
 
-    result = api_request("GET", "/api/agent-drops", params=params)
-    drops = result.get("drops", [])
+    if args.since or not args.limit:
+        # Explicit filters bypass the cursor, which only tracks the newest-N window
+        if args.since:
+            params["since"] = args.since
+        result = api_request("GET", "/api/agent-drops", params=params,
+                             cache_ttl=None if args.refresh else LIST_CACHE_TTL)
+        drops = result.get("drops", [])
+    else:
+        drops = fetch_since_cursor(args, params)
 
     if not drops:
         print("No drops found.")
         return
 
-    print(f"{len(drops)} drop(s):\n")
+    # Built up and written once rather than a print() per line
+    lines = [f"{len(drops)} drop(s):\n\n"]
+    row = LIST_ROW.format
     for d in drops:
-        cdn = "cdn" if d.get("cdn_url") else "git"
-        print(f"  [{d.get('type', '?'):10}] {d.get('id', '?')}")
-        print(f"             from={d.get('from')} {cdn} {d.get('timestamp', '')[:19]}")
-        if d.get("cdn_url"):
-            print(f"             {d['cdn_url']}")
-        print()
+        cdn_url = d.get("cdn_url")
+        lines.append(row(
+            type=d.get("type", "?"),
+            id=d.get("id", "?"),
+            sender=d.get("from"),
+            store="cdn" if cdn_url else "git",
+            ts=(d.get("timestamp") or "")[:19],
+        ))
+        if cdn_url:
+            lines.append(f"             {cdn_url}\n")
+        lines.append("\n")
+    sys.stdout.write("".join(lines))
 
 
 def cmd_read(args):
-    """Read a specific drop."""
-    result = api_request("GET", f"/api/agent-drops/{args.drop_id}")
-    drop = result.get("drop", {})
-    if drop.get("content"):
-        print(drop["content"])
-    else:
-        print(json.dumps(drop, indent=2))
+    """Read one or more drops by ID."""
+    def fetch(drop_id):
+        return api_request("GET", f"/api/agent-drops/{drop_id}").get("drop", {})
+
+    def show(drop):
+        if drop.get("content"):
+            print(drop["content"])
+        else:
+            print(json.dumps(drop, indent=2))
+
+    fan_out(fetch, args.drop_ids, show)
 
 
 def main():
@@ -154,8 +683,8 @@ def main():
         description="Universal agent drop CLI — posts to oPOErator hub",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
-    # Default: drop a file
-    parser.add_argument("file", nargs="?", help="Markdown file to drop")
+    # Default: drop one or more files
+    parser.add_argument("files", nargs="*", metavar="file", help="Markdown file(s) to drop")
     parser.add_argument("--stdin", action="store_true", help="Read content from stdin")
     parser.add_argument("--from", dest="sender", default=None,
                         help="Who's dropping (default: claude-code for new drops)")
@@ -168,22 +697,26 @@ def main():
     parser.add_argument("--list", action="store_true", help="List drops instead of creating")
     parser.add_argument("--since", help="Filter: only drops after this ISO timestamp")
     parser.add_argument("--limit", type=int, default=20, help="Max results (default 20)")
+    parser.add_argument("--refresh", action="store_true",
+                        help="Ignore the local list cursor/cache and fetch everything")
 
     # Read mode
-    parser.add_argument("--read", dest="drop_id", help="Read a specific drop by ID")
+    parser.add_argument("--read", dest="drop_ids", nargs="+", metavar="DROP_ID",
+                        help="Read one or more drops by ID")
 
-    args = parser.parse_args()
+    # Intermixed so files can follow options: drop.py a.md --from x b.md
+    args = parser.parse_intermixed_args()
 
     if not API_KEY:
         print("No API key found. Set DROP_API_KEY or INGEST_API_KEY env var,", file=sys.stderr)
         print("or create a .env file with INGEST_API_KEY=...", file=sys.stderr)
         sys.exit(1)
 
-    if args.drop_id:
+    if args.drop_ids:
         cmd_read(args)
     elif args.list:
         cmd_list(args)
-    elif args.file or args.stdin:
+    elif args.files or args.stdin:
         cmd_drop(args)
     else:
         parser.print_help()